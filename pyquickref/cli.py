@@ -4,9 +4,9 @@ import argparse
 import difflib
 import sys
 
-import pyquickref.examples  # noqa: F401  — trigger @example registration
 from pyquickref import __version__
 from pyquickref.core import list_examples, run_examples, run_lesson
+from pyquickref.examples import load_all
 from pyquickref.registry import get_example, get_lesson, get_lessons, get_registry
 
 EPILOG = """\
@@ -58,7 +58,20 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     """Entry point for the pyquickref CLI."""
+    # Answer the single-flag invocations without building the argparse parser.
+    argv = sys.argv[1:]
+    if argv in (["-V"], ["--version"]):
+        print(f"pyquickref {__version__}")
+        return
+    if argv in (["-l"], ["--list"]):
+        load_all()
+        list_examples()
+        return
+
     args = parse_args()
+    # --help and --version exit inside parse_args(), before any example
+    # module is imported.
+    load_all()
 
     if args.list_examples:
         list_examples()
@@ -78,9 +91,9 @@ def main() -> None:
     functions_to_run: list[str] | None = None
 
     if args.examples:
-        all_names = list(get_registry())
         bad = [name for name in args.examples if get_example(name) is None]
         if bad:
+            all_names = list(get_registry())
             for name in bad:
                 print(f"Unknown example: '{name}'")
                 close = difflib.get_close_matches(name, all_names, n=3, cutoff=0.4)
@@ -1,27 +1,36 @@
 """Example modules for PyQuickRef.
 
-Importing this package triggers all @example decorator registrations.
+Call ``load_all()`` to import every example module and trigger the
+@example decorator registrations. Importing this package alone is cheap.
 """
 
-from pyquickref.examples import (  # noqa: F401
-    advanced,
-    advanced_oop,
-    classes,
-    collections_ops,
-    concurrency,
-    control_flow,
-    data_structures,
-    design_patterns,
-    error_handling,
-    file_operations,
-    functional,
-    iterators_context,
-    loops,
-    modern,
-    modules_packaging,
-    practical_patterns,
-    stdlib_tools,
-    strings,
-    testing_debugging,
-    type_system,
+import importlib
+
+_MODULES = (
+    "advanced",
+    "advanced_oop",
+    "classes",
+    "collections_ops",
+    "concurrency",
+    "control_flow",
+    "data_structures",
+    "design_patterns",
+    "error_handling",
+    "file_operations",
+    "functional",
+    "iterators_context",
+    "loops",
+    "modern",
+    "modules_packaging",
+    "practical_patterns",
+    "stdlib_tools",
+    "strings",
+    "testing_debugging",
+    "type_system",
 )
+
+
+def load_all() -> None:
+    """Import all example modules so their examples are registered."""
+    for name in _MODULES:
+        importlib.import_module(f"{__name__}.{name}")
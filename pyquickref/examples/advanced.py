@@ -8,9 +8,17 @@ import itertools
 import json
 import os
 import re
+from pathlib import Path
 
 from pyquickref.registry import example, show
 
+_EXAMPLE_JSON_PATH = Path(__file__).resolve().parents[2] / "data" / "json_example.json"
+
+# Compiled once at import; each call then goes straight to the pattern object.
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_EMAIL_PREFIX_RE = re.compile(r"[A-Za-z0-9._%+-]+@")
+
 
 @example(
     "Advanced",
@@ -51,15 +59,9 @@ def json_operations(output_dir: str) -> None:
         print(f"Error saving JSON to file: {e}")
 
     # Load example json if it exists
-    example_json_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-        "data",
-        "json_example.json",
-    )
-    if os.path.exists(example_json_path):
+    if _EXAMPLE_JSON_PATH.exists():
         try:
-            with open(example_json_path) as f:
-                example_data = json.load(f)
+            example_data = json.loads(_EXAMPLE_JSON_PATH.read_bytes())
             print("\nLoaded example JSON data:")
             print(f"Name: {example_data.get('name')}")
             print(f"Description: {example_data.get('description')}")
@@ -80,22 +82,29 @@ def regex_patterns() -> None:
     text = "Contact us at info@example.com or support@python.org"
 
     # Find all email addresses
-    email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    show(r"re.findall(r'\b[A-Za-z0-9._%+-]+@...', text)")
-    emails = re.findall(email_pattern, text)
+    show(
+        "email_re = re.compile(r'\\b[A-Za-z0-9._%+-]+@...')\n"
+        "email_re.findall(text)  # same as re.findall(pattern, text)"
+    )
+    emails = _EMAIL_RE.findall(text)
     print(f"Emails found: {emails}")
 
     # Match pattern
     date_text = "Today's date is 2023-11-25"
-    date_pattern = r"\d{4}-\d{2}-\d{2}"
-    show(r"re.search(r'\d{4}-\d{2}-\d{2}', text)")
-    match = re.search(date_pattern, date_text)
+    show(
+        "date_re = re.compile(r'\\d{4}-\\d{2}-\\d{2}')\n"
+        "date_re.search(text)  # same as re.search(pattern, text)"
+    )
+    match = _DATE_RE.search(date_text)
     if match:
         print(f"Date found: {match.group()}")
 
     # Replace with regex
-    show("re.sub(r'[email]+@', 'EMAIL@', text)")
-    censored = re.sub(r"[A-Za-z0-9._%+-]+@", "EMAIL@", text)
+    show(
+        "prefix_re = re.compile(r'[A-Za-z0-9._%+-]+@')\n"
+        "prefix_re.sub('EMAIL@', text)  # same as re.sub(pattern, 'EMAIL@', text)"
+    )
+    censored = _EMAIL_PREFIX_RE.sub("EMAIL@", text)
     print(f"Censored text: {censored}")
 
 
@@ -123,9 +132,9 @@ def itertools_examples() -> None:
     # Product
     dice1 = [1, 2, 3, 4, 5, 6]
     dice2 = [1, 2, 3, 4, 5, 6]
-    show("itertools.product(dice1, dice2)")
+    show("itertools.islice(itertools.product(dice1, dice2), 5)")
     print("\nSome possible dice rolls (first 5):")
-    for roll in list(itertools.product(dice1, dice2))[:5]:
+    for roll in itertools.islice(itertools.product(dice1, dice2), 5):
         roll_sum = sum(roll)
         print(f"Dice 1: {roll[0]}, Dice 2: {roll[1]}, Sum: {roll_sum}")
 
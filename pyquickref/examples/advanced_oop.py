@@ -4,6 +4,8 @@ Descriptors, metaclasses, protocols, and abstract base classes.
 Docs: https://docs.python.org/3/reference/datamodel.html#descriptors
 """
 
+import json
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, Protocol, runtime_checkable
 
@@ -31,7 +33,7 @@ def descriptors_example() -> None:
             return getattr(obj, self.storage_name, None)
 
         def __set__(self, obj: Any, value: Any) -> None:
-            if not isinstance(value, int | float) or value < 0:
+            if not isinstance(value, (int, float)) or value < 0:
                 msg = f"{self.name} must be non-negative, got {value!r}"
                 raise ValueError(msg)
             setattr(obj, self.storage_name, value)
@@ -44,6 +46,9 @@ def descriptors_example() -> None:
     class Product:
         """A product with validated price and quantity."""
 
+        # Backing storage for the Validated descriptors (see storage_name)
+        __slots__ = ("name", "_validated_price", "_validated_quantity")
+
         price = Validated("price")
         quantity = Validated("quantity")
 
@@ -90,7 +95,10 @@ def metaclass_example() -> None:
     class RegistryMeta(type):
         """A metaclass that auto-registers all subclasses."""
 
-        _registry: dict[str, type] = {}
+        # Weak values: a class that is no longer referenced can be collected
+        _registry: weakref.WeakValueDictionary[str, type] = (
+            weakref.WeakValueDictionary()
+        )
 
         def __new__(mcs, name: str, bases: tuple, namespace: dict) -> type:  # noqa: ANN001
             cls = super().__new__(mcs, name, bases, namespace)
@@ -175,13 +183,9 @@ def protocols_abcs() -> None:
             self.data = data or {}
 
         def serialize(self) -> str:
-            import json
-
             return json.dumps(self.data)
 
         def deserialize(self, data: str) -> None:
-            import json
-
             self.data = json.loads(data)
 
     show(JsonRecord)
@@ -18,6 +18,8 @@ def class_basics() -> None:
     class Animal:
         """A basic animal with a name and sound."""
 
+        __slots__ = ("name", "sound")
+
         def __init__(self, name: str, sound: str) -> None:
             self.name = name
             self.sound = sound
@@ -33,6 +35,8 @@ def class_basics() -> None:
     class Dog(Animal):
         """A dog that inherits from Animal."""
 
+        __slots__ = ("breed",)
+
         def __init__(self, name: str, breed: str) -> None:
             super().__init__(name, "woof")
             self.breed = breed
@@ -49,6 +53,8 @@ def class_basics() -> None:
     class Circle:
         """A circle defined by its radius."""
 
+        __slots__ = ("radius",)
+
         def __init__(self, radius: float) -> None:
             self.radius = radius
 
@@ -69,6 +75,8 @@ def class_basics() -> None:
     class Temperature:
         """A temperature in Celsius with Fahrenheit conversion."""
 
+        __slots__ = ("_celsius",)
+
         def __init__(self, celsius: float) -> None:
             self._celsius = celsius
 
@@ -93,6 +101,8 @@ def dunder_methods() -> None:
     class Vector:
         """A 2D vector with arithmetic operations."""
 
+        __slots__ = ("x", "y")
+
         def __init__(self, x: float, y: float) -> None:
             self.x = x
             self.y = y
@@ -109,7 +119,11 @@ def dunder_methods() -> None:
             return self.x == other.x and self.y == other.y
 
         def __lt__(self, other: "Vector") -> bool:
-            return (self.x**2 + self.y**2) < (other.x**2 + other.y**2)
+            # Compare squared magnitudes — no sqrt needed to order vectors
+            return (
+                self.x * self.x + self.y * self.y
+                < other.x * other.x + other.y * other.y
+            )
 
         def __add__(self, other: "Vector") -> "Vector":
             return Vector(self.x + other.x, self.y + other.y)
@@ -74,11 +74,15 @@ def threading_example() -> None:
     lock = threading.Lock()
 
     def increment(n: int) -> None:
-        for _ in range(n):
-            with lock:
-                counter["value"] += 1
+        with lock:
+            counter["value"] += n
 
-    show("lock = threading.Lock()\nwith lock:\n    counter += 1")
+    show(
+        "lock = threading.Lock()\n\n"
+        "def increment(n):\n"
+        "    with lock:  # read-modify-write must not interleave\n"
+        "        counter['value'] += n"
+    )
     threads = [threading.Thread(target=increment, args=(1000,)) for _ in range(4)]
     for t in threads:
         t.start()
@@ -124,11 +128,19 @@ def multiprocessing_example() -> None:
     show(
         "def cube(n: int) -> int:\n"
         "    return n ** 3\n\n"
-        "with ProcessPoolExecutor(max_workers=2) as pool:\n"
-        "    results = list(pool.map(cube, range(5)))"
+        "items = range(5)\n"
+        "workers = 2\n"
+        "# chunksize sends items in batches — fewer pickling round-trips\n"
+        "# (with only 5 items this works out to 1; it matters for large inputs)\n"
+        "chunksize = max(1, len(items) // (workers * 4))\n"
+        "with ProcessPoolExecutor(max_workers=workers) as pool:\n"
+        "    results = list(pool.map(cube, items, chunksize=chunksize))"
     )
-    with ProcessPoolExecutor(max_workers=2) as pool:
-        cubes = list(pool.map(_cube, range(5)))
+    items = range(5)
+    workers = 2
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        cubes = list(pool.map(_cube, items, chunksize=chunksize))
     print(f"ProcessPool cubes: {cubes}")
 
     # multiprocessing.Value for shared state
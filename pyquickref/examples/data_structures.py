@@ -136,6 +136,12 @@ def star_unpacking() -> None:
     merged = defaults | overrides
     print(f"Merged (|): {merged}")
 
+    # |= updates in place — copy first to keep the original intact
+    show("merged = defaults.copy()\nmerged |= overrides")
+    merged = defaults.copy()
+    merged |= overrides
+    print(f"Merged (|=): {merged}")
+
     # Variable swap
     show("a, b = b, a")
     a, b = 1, 2
@@ -223,7 +229,7 @@ def list_iterate(data: SampleData) -> None:
 def conditional_check(data: SampleData) -> None:
     """Check if a specific item exists in the list."""
     item = "banana"
-    show(f"'{item}' in ['apple', 'banana', 'cherry']")
+    show("'banana' in ['apple', 'banana', 'cherry']")
     if item in data.testlist:
         print(f"'{item}' is in the list!")
     else:
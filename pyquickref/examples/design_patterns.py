@@ -14,52 +14,84 @@ from dataclasses import dataclass, field
 from pyquickref.registry import example, show
 
 
-@example(
-    "Design Patterns",
-    "ABC + factory function to create objects by type",
-    doc_url="https://docs.python.org/3/library/abc.html",
-)
-def factory_pattern() -> None:
-    """Demonstrate the factory pattern using ABC and a factory function."""
+class Notification(ABC):
+    """Base class for notification channels."""
+
+    @abstractmethod
+    def send(self: "Notification", message: str) -> str:
+        """Deliver message and return a description of what was sent."""
+
+
+class EmailNotification(Notification):
+    """Send notifications via email."""
+
+    def send(self: "EmailNotification", message: str) -> str:
+        """Deliver message as an email."""
+        return f"Email: {message}"
+
+
+class SMSNotification(Notification):
+    """Send notifications via SMS."""
+
+    def send(self: "SMSNotification", message: str) -> str:
+        """Deliver message as an SMS."""
+        return f"SMS: {message}"
+
+
+class PushNotification(Notification):
+    """Send notifications via push."""
+
+    def send(self: "PushNotification", message: str) -> str:
+        """Deliver message as a push notification."""
+        return f"Push: {message}"
 
-    class Notification(ABC):
-        """Base class for notification channels."""
 
-        @abstractmethod
-        def send(self: "Notification", message: str) -> str: ...
+_NOTIFICATION_TYPES: dict[str, type[Notification]] = {
+    "email": EmailNotification,
+    "sms": SMSNotification,
+    "push": PushNotification,
+}
 
-    class EmailNotification(Notification):
-        """Send notifications via email."""
 
-        def send(self: "EmailNotification", message: str) -> str:
-            return f"Email: {message}"
+def create_notification(kind: str) -> Notification:
+    """Create a notification instance by type name."""
+    try:
+        cls = _NOTIFICATION_TYPES[kind]
+    except KeyError:
+        msg = f"Unknown notification type: {kind}"
+        raise ValueError(msg) from None
+    return cls()
 
-    class SMSNotification(Notification):
-        """Send notifications via SMS."""
 
-        def send(self: "SMSNotification", message: str) -> str:
-            return f"SMS: {message}"
+def full_price(amount: float) -> float:
+    """Apply no discount."""
+    return amount
 
-    class PushNotification(Notification):
-        """Send notifications via push."""
 
-        def send(self: "PushNotification", message: str) -> str:
-            return f"Push: {message}"
+def ten_percent_off(amount: float) -> float:
+    """Apply a 10% discount."""
+    return amount * 0.9
 
-    types: dict[str, type[Notification]] = {
-        "email": EmailNotification,
-        "sms": SMSNotification,
-        "push": PushNotification,
-    }
 
-    def create_notification(kind: str) -> Notification:
-        """Create a notification instance by type name."""
-        cls = types.get(kind)
-        if cls is None:
-            msg = f"Unknown notification type: {kind}"
-            raise ValueError(msg)
-        return cls()
+def member_discount(amount: float) -> float:
+    """Apply a 20% member discount."""
+    return amount * 0.8
 
+
+_STRATEGIES: tuple[tuple[str, Callable[[float], float]], ...] = (
+    ("full_price", full_price),
+    ("ten_percent_off", ten_percent_off),
+    ("member_discount", member_discount),
+)
+
+
+@example(
+    "Design Patterns",
+    "ABC + factory function to create objects by type",
+    doc_url="https://docs.python.org/3/library/abc.html",
+)
+def factory_pattern() -> None:
+    """Demonstrate the factory pattern using ABC and a factory function."""
     show(create_notification)
     for kind in ["email", "sms", "push"]:
         notif = create_notification(kind)
@@ -74,19 +106,7 @@ def factory_pattern() -> None:
 def strategy_pattern() -> None:
     """Demonstrate the strategy pattern with callable strategies."""
 
-    def full_price(amount: float) -> float:
-        """Apply no discount."""
-        return amount
-
-    def ten_percent_off(amount: float) -> float:
-        """Apply a 10% discount."""
-        return amount * 0.9
-
-    def member_discount(amount: float) -> float:
-        """Apply a 20% member discount."""
-        return amount * 0.8
-
-    @dataclass
+    @dataclass(slots=True)
     class Order:
         """An order with configurable pricing strategy."""
 
@@ -97,12 +117,7 @@ def strategy_pattern() -> None:
             return self.pricing(self.total)
 
     show(Order)
-    strategies = [
-        ("full_price", full_price),
-        ("ten_percent_off", ten_percent_off),
-        ("member_discount", member_discount),
-    ]
-    for name, strategy in strategies:
+    for name, strategy in _STRATEGIES:
         order = Order(total=100.0, pricing=strategy)
         print(f"  {name}: ${order.final_price():.2f}")
 
@@ -115,17 +130,21 @@ def strategy_pattern() -> None:
 def observer_pattern() -> None:
     """Demonstrate the observer pattern with an event emitter."""
 
-    @dataclass
+    @dataclass(slots=True)
     class EventEmitter:
         """A simple pub/sub event system."""
 
-        _listeners: dict[str, list[Callable[..., None]]] = field(default_factory=dict)
+        # Tuples are replaced, never mutated, so a listener that subscribes
+        # during emit() doesn't affect the loop already in progress.
+        _listeners: dict[str, tuple[Callable[..., None], ...]] = field(
+            default_factory=dict
+        )
 
         def on(self: "EventEmitter", event: str, callback: Callable[..., None]) -> None:
-            self._listeners.setdefault(event, []).append(callback)
+            self._listeners[event] = (*self._listeners.get(event, ()), callback)
 
         def emit(self: "EventEmitter", event: str, *args: object) -> None:
-            for cb in self._listeners.get(event, []):
+            for cb in self._listeners.get(event, ()):
                 cb(*args)
 
     show(EventEmitter)
@@ -146,7 +165,7 @@ def observer_pattern() -> None:
 def builder_pattern() -> None:
     """Demonstrate the builder pattern with fluent interface."""
 
-    @dataclass
+    @dataclass(slots=True)
     class HttpRequest:
         """An HTTP request with method, URL, headers, and body."""
 
@@ -258,30 +277,37 @@ def rate_limiter() -> None:
     class TokenBucket:
         """Rate limiter using the token bucket algorithm."""
 
-        def __init__(self: "TokenBucket", rate: float, capacity: int) -> None:
-            self.rate = rate
-            self.capacity = capacity
-            self.tokens = float(capacity)
-            self.last_refill = time.monotonic()
+        ONE_TOKEN = 1_000_000_000  # tokens are counted in billionths
+        NS_PER_SECOND = 1_000_000_000
 
-        def _refill(self: "TokenBucket") -> None:
-            now = time.monotonic()
-            elapsed = now - self.last_refill
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_refill = now
+        def __init__(self: "TokenBucket", rate: float, capacity: int) -> None:
+            # Rate and balance share one unit (billionths of a token), so the
+            # refill below is integer math on monotonic_ns() timestamps
+            self._rate = round(rate * self.ONE_TOKEN)  # per second
+            self._max_tokens = capacity * self.ONE_TOKEN
+            self._tokens = self._max_tokens
+            self._last_ns = time.monotonic_ns()
+            self._remainder = 0  # sub-billionth refill carried to the next call
 
         def acquire(self: "TokenBucket") -> bool:
-            """Try to consume a token; return True if allowed."""
-            self._refill()
-            if self.tokens >= 1:
-                self.tokens -= 1
+            """Refill for the elapsed time, then try to consume a token."""
+            now = time.monotonic_ns()
+            refill, self._remainder = divmod(
+                (now - self._last_ns) * self._rate + self._remainder,
+                self.NS_PER_SECOND,
+            )
+            self._tokens = min(self._max_tokens, self._tokens + refill)
+            self._last_ns = now
+            if self._tokens >= self.ONE_TOKEN:
+                self._tokens -= self.ONE_TOKEN
                 return True
             return False
 
     show(TokenBucket)
 
-    bucket = TokenBucket(rate=5, capacity=3)
-    print(f"  Rate: {bucket.rate}/s, capacity: {bucket.capacity}")
+    rate, capacity = 5, 3
+    bucket = TokenBucket(rate=rate, capacity=capacity)
+    print(f"  Rate: {rate}/s, capacity: {capacity}")
 
     allowed = 0
     denied = 0
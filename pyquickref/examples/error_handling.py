@@ -14,7 +14,11 @@ class InsufficientFundsError(Exception):
         """Initialize with current balance and requested withdrawal amount."""
         self.balance = balance
         self.amount = amount
-        super().__init__(f"Cannot withdraw ${amount:.2f}, balance is ${balance:.2f}")
+        super().__init__(balance, amount)
+
+    def __str__(self: "InsufficientFundsError") -> str:
+        """Format the message only when the exception is displayed."""
+        return f"Cannot withdraw ${self.amount:.2f}, balance is ${self.balance:.2f}"
 
 
 @example(
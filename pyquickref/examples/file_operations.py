@@ -12,6 +12,18 @@ from collections.abc import Iterator
 from pyquickref.registry import example, show
 
 
+@contextlib.contextmanager
+def string_io() -> Iterator[io.StringIO]:
+    """Context manager that captures writes to an in-memory string buffer."""
+    output = io.StringIO()
+    try:
+        yield output
+    finally:
+        value = output.getvalue()
+        output.close()
+        print(f"Captured: {value}")
+
+
 @example(
     "File Operations",
     "Write text to a file using open()",
@@ -48,17 +60,6 @@ def context_managers(output_dir: str) -> None:
         print(f"Error writing to file: {e}")
 
     # Custom context manager using contextlib
-    @contextlib.contextmanager
-    def string_io() -> Iterator[io.StringIO]:
-        """Context manager that captures writes to an in-memory string buffer."""
-        output = io.StringIO()
-        try:
-            yield output
-        finally:
-            value = output.getvalue()
-            output.close()
-            print(f"Captured: {value}")
-
     show(string_io)
     with string_io() as s:
         s.write("Hello, context manager!")
@@ -4,10 +4,13 @@ Function basics, lambda functions, decorators, and higher-order functions.
 Docs: https://docs.python.org/3/howto/functional.html
 """
 
+import math
 import time
 from collections.abc import Callable
 from functools import wraps
+from operator import itemgetter
 from typing import Any
+from urllib.parse import urlencode
 
 from pyquickref.registry import example, show
 
@@ -44,7 +47,7 @@ def function_basics() -> None:
 
     def build_url(base: str, **params: str) -> str:
         """Build a URL with query parameters from keyword arguments."""
-        query = "&".join(f"{k}={v}" for k, v in params.items())
+        query = urlencode(params)  # from urllib.parse; percent-encodes values
         return f"{base}?{query}" if query else base
 
     show(build_url)
@@ -79,9 +82,9 @@ def builtin_functions() -> None:
     print(f"Reverse alpha: {sorted(words, key=str.lower, reverse=True)}")
 
     people = [("Alice", 30), ("Bob", 25), ("Charlie", 35)]
-    show("min(people, key=lambda p: p[1])")
-    youngest = min(people, key=lambda p: p[1])
-    oldest = max(people, key=lambda p: p[1])
+    show("min(people, key=itemgetter(1))  # from operator; same as lambda p: p[1]")
+    youngest = min(people, key=itemgetter(1))
+    oldest = max(people, key=itemgetter(1))
     print(f"Youngest: {youngest[0]} ({youngest[1]})")
     print(f"Oldest:   {oldest[0]} ({oldest[1]})")
 
@@ -149,6 +152,10 @@ def recursion_example() -> None:
     print(f"factorial(5) = {factorial(5)}")
     print(f"factorial(10) = {factorial(10)}")
 
+    # In real code, prefer the stdlib's C implementation
+    show("math.factorial(10)")
+    print(f"math.factorial(10) = {math.factorial(10)}")
+
     def flatten(lst: list[Any]) -> list[Any]:
         """Recursively flatten nested lists into a single list."""
         result: list[Any] = []
@@ -206,9 +213,9 @@ def decorator_example() -> None:
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()  # monotonic, high resolution
             result = func(*args, **kwargs)
-            elapsed = time.time() - start_time
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             print(f"Function {func_name} took {elapsed:.4f} seconds to run")
             return result
 
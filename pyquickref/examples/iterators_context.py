@@ -6,6 +6,8 @@ Docs: https://docs.python.org/3/library/stdtypes.html#iterator-types
 
 import contextlib
 import io
+import time
+from collections.abc import Iterable, Iterator
 
 from pyquickref.registry import example, show
 
@@ -51,12 +53,13 @@ def iterator_protocol() -> None:
     # Iterable vs iterator
     show(
         "# A list is iterable (has __iter__) but is NOT an iterator\n"
-        "# iter(list) returns a list_iterator (has __next__)"
+        "# iter(list) returns a list_iterator (has __next__)\n"
+        "# collections.abc.Iterable / Iterator check for these methods"
     )
     nums = [1, 2, 3]
-    print(f"hasattr(list, '__iter__')     = {hasattr(nums, '__iter__')}")
-    print(f"hasattr(list, '__next__')     = {hasattr(nums, '__next__')}")
-    print(f"hasattr(iter(list), '__next__') = {hasattr(iter(nums), '__next__')}")
+    print(f"isinstance(list, Iterable)       = {isinstance(nums, Iterable)}")
+    print(f"isinstance(list, Iterator)       = {isinstance(nums, Iterator)}")
+    print(f"isinstance(iter(list), Iterator) = {isinstance(iter(nums), Iterator)}")
 
 
 @example(
@@ -70,19 +73,17 @@ def context_manager_example() -> None:
     class Timer:
         """A context manager that measures elapsed time."""
 
+        __slots__ = ("label", "elapsed", "_start")
+
         def __init__(self, label: str) -> None:
             self.label = label
             self.elapsed: float = 0.0
 
         def __enter__(self) -> "Timer":
-            import time
-
             self._start = time.monotonic()
             return self
 
         def __exit__(self, exc_type, exc_val, exc_tb) -> bool:  # noqa: ANN001
-            import time
-
             self.elapsed = time.monotonic() - self._start
             # Return False to propagate exceptions
             return False
@@ -97,6 +98,8 @@ def context_manager_example() -> None:
     class Suppressor:
         """Suppress a specific exception type."""
 
+        __slots__ = ("exc_type",)
+
         def __init__(self, exc_type: type) -> None:
             self.exc_type = exc_type
 
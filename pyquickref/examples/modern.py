@@ -4,6 +4,7 @@ Dataclasses, pattern matching, generators, walrus operator, enums, type hints.
 Docs: https://docs.python.org/3/whatsnew/3.10.html
 """
 
+import math
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any
@@ -19,7 +20,7 @@ class Color(Enum):
     BLUE = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Point:
     """A 2D point using dataclass."""
 
@@ -28,10 +29,10 @@ class Point:
 
     def distance_to(self: "Point", other: "Point") -> float:
         """Calculate Euclidean distance to another point."""
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        return math.hypot(self.x - other.x, self.y - other.y)
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Configuration with defaults and field factories."""
 
@@ -7,11 +7,12 @@ import os
 import random
 import threading
 import time
-from collections import ChainMap
+from collections import ChainMap, defaultdict
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from functools import lru_cache, wraps
 from itertools import groupby
+from operator import itemgetter
 from typing import Any, NamedTuple
 
 from pyquickref.registry import example, show
@@ -103,17 +104,18 @@ def timeout_wrapper() -> None:
 @example(
     "Practical Patterns",
     "Compose functions into a data processing pipeline",
-    doc_url="https://docs.python.org/3/library/functools.html#functools.reduce",
+    doc_url="https://docs.python.org/3/howto/functional.html",
 )
 def pipeline_pattern() -> None:
     """Demonstrate function composition pipeline."""
-    from functools import reduce
 
     def pipeline(*steps: Callable[..., Any]) -> Callable[..., Any]:
         """Chain functions into a left-to-right data pipeline."""
 
         def run(data: Any) -> Any:
-            return reduce(lambda d, step: step(d), steps, data)
+            for step in steps:
+                data = step(data)
+            return data
 
         return run
 
@@ -123,8 +125,8 @@ def pipeline_pattern() -> None:
     print(f"  '  JOHN DOE  ' → {process_name('  JOHN DOE  ')!r}")
 
     process_numbers = pipeline(
-        lambda nums: [x for x in nums if x > 0],
-        lambda nums: [x**2 for x in nums],
+        lambda nums: (x for x in nums if x > 0),
+        lambda nums: (x * x for x in nums),
         sum,
     )
     result = process_numbers([-1, 2, -3, 4, 5])
@@ -146,6 +148,8 @@ def batch_processing() -> None:
         it = iter(iterable)
         while batch := list(islice(it, n)):
             yield batch
+            if len(batch) < n:
+                return  # short chunk means the input is exhausted
 
     show(batched)
 
@@ -164,7 +168,7 @@ def batch_processing() -> None:
 )
 def groupby_aggregate() -> None:
     """Demonstrate groupby for grouping and aggregation."""
-    sales = [
+    sales: list[dict[str, Any]] = [
         {"region": "North", "amount": 100},
         {"region": "South", "amount": 200},
         {"region": "North", "amount": 150},
@@ -173,20 +177,39 @@ def groupby_aggregate() -> None:
     ]
 
     show(
-        "from itertools import groupby\n\n"
+        "from itertools import groupby\n"
+        "from operator import itemgetter\n\n"
         "sales = [{'region': 'North', 'amount': 100}, ...]\n"
-        "sorted_sales = sorted(sales, key=lambda s: s['region'])\n"
-        "for region, group in groupby(sorted_sales, key=...):\n"
+        "region_key = itemgetter('region')\n"
+        "sorted_sales = sorted(sales, key=region_key)\n"
+        "for region, group in groupby(sorted_sales, key=region_key):\n"
         "    items = list(group)\n"
         "    total = sum(s['amount'] for s in items)"
     )
 
-    sorted_sales = sorted(sales, key=lambda s: s["region"])
-    for region, group in groupby(sorted_sales, key=lambda s: s["region"]):
+    region_key = itemgetter("region")
+    sorted_sales = sorted(sales, key=region_key)
+    for region, group in groupby(sorted_sales, key=region_key):
         items = list(group)
         total = sum(s["amount"] for s in items)
         print(f"  {region}: {len(items)} sales, total=${total}")
 
+    # When only totals are needed, one dict pass avoids the sort entirely
+    show(
+        "counts, totals = defaultdict(int), defaultdict(int)\n"
+        "for s in sales:\n"
+        "    counts[s['region']] += 1\n"
+        "    totals[s['region']] += s['amount']"
+    )
+
+    counts: defaultdict[str, int] = defaultdict(int)
+    totals: defaultdict[str, int] = defaultdict(int)
+    for s in sales:
+        counts[s["region"]] += 1
+        totals[s["region"]] += s["amount"]
+    for region, total in totals.items():
+        print(f"  Single pass {region}: {counts[region]} sales, total=${total}")
+
 
 @example(
     "Practical Patterns",
@@ -329,12 +352,14 @@ def memoize_pattern() -> None:
     ) -> Callable[..., Any]:
         """Cache function results by arguments."""
         cache: dict[Any, Any] = {}
+        missing = object()  # sentinel: None could be a cached result
 
         @wraps(func)
         def wrapper(*args: Any) -> Any:
-            if args not in cache:
-                cache[args] = func(*args)
-            return cache[args]
+            result = cache.get(args, missing)  # hit: a single dict lookup
+            if result is missing:
+                result = cache[args] = func(*args)
+            return result
 
         wrapper.cache = cache  # type: ignore[attr-defined]
         return wrapper
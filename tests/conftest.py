@@ -8,9 +8,11 @@ from typing import Any
 import pytest
 from pytest import CaptureFixture
 
-import pyquickref.examples  # noqa: F401  — trigger registration
+from pyquickref.examples import load_all
 from pyquickref.testdata import SampleData
 
+load_all()
+
 
 @pytest.fixture
 def temp_dir() -> Generator[str, None, None]:
@@ -58,6 +58,7 @@ def test_star_unpacking(capture_output: Callable) -> None:
     assert "first = 1, rest = [2, 3, 4, 5]" in output
     assert "middle = [2, 3, 4]" in output
     assert "Merged:" in output
+    assert "Merged (|=):" in output
     assert "'size': 'large'" in output
     assert "After swap: a=2, b=1" in output
 
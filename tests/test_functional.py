@@ -50,6 +50,7 @@ def test_recursion_example(capture_output: Callable) -> None:
     output = capture_output(recursion_example)
     assert "factorial(5) = 120" in output
     assert "factorial(10) = 3628800" in output
+    assert "math.factorial(10) = 3628800" in output
     assert "flatten(" in output
     assert "[1, 2, 3, 4, 5, 6, 7]" in output
 
@@ -17,6 +17,9 @@ def test_iterator_protocol(capture_output: Callable) -> None:
     assert "next(it, 'done') = done" in output
     assert "__iter__" in output
     assert "__next__" in output
+    assert "isinstance(list, Iterable)       = True" in output
+    assert "isinstance(list, Iterator)       = False" in output
+    assert "isinstance(iter(list), Iterator) = True" in output
 
 
 def test_context_manager_example(capture_output: Callable) -> None:
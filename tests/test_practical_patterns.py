@@ -51,6 +51,7 @@ def test_groupby_aggregate(capture_output: Callable) -> None:
     assert "North:" in output
     assert "South:" in output
     assert "total=$" in output
+    assert "Single pass North: 3 sales, total=$500" in output
 
 
 def test_config_cascade(capture_output: Callable) -> None: